@@ -24,6 +24,10 @@ ANTHROPIC_MODEL_LIGHT = "claude-haiku-4-5-20251001"  # Lightweight model for sum
 MAX_TOKENS = 4096
 TEMPERATURE = 0.1  # Low temperature for regulatory precision
 
+# --- MedGemma weight quantization (bitsandbytes) ---
+# int4: NF4 + double quant (default, ~3.2 GB VRAM) | int8: LLM.int8() | none: bf16 weights
+MEDGEMMA_QUANT = os.environ.get("MEDGEMMA_QUANT", "int4").strip().lower()
+
 # --- Clinical Constants (NAM 2024 & WHO AEFI) ---
 # NAM 2024 Evidence Review: mRNA vaccine → myocarditis causal window
 NAM_CAUSAL_WINDOW_DAYS = 7       # 0-7 days: strong causal association
@@ -78,6 +82,7 @@ VAERS_INPUT_COLUMNS = [
     "AGE_YRS", "SEX", "VAX_NAME", "VAX_MANU", "VAX_DOSE_SERIES",
     "DIED", "L_THREAT", "ER_VISIT", "HOSPITAL", "HOSPDAYS",
     "SYMPTOM1", "SYMPTOM2", "SYMPTOM3", "SYMPTOM4", "SYMPTOM5",
+    "STATE", "VAX_LOT", "VAX_ROUTE", "VAX_SITE", "RECOVD",
 ]
 
 # Curated columns for ground truth validation
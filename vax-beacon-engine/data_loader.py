@@ -7,11 +7,14 @@ Parses the curated CSV and prepares input for each pipeline stage.
 import pandas as pd
 from config import DATA_PATH, VAERS_INPUT_COLUMNS, GROUND_TRUTH_COLUMNS
 
+# Only the columns the pipeline reads are parsed (the cohort CSV carries ~60)
+_COHORT_COLUMNS = frozenset(VAERS_INPUT_COLUMNS + GROUND_TRUTH_COLUMNS)
+
 
 def load_vaers_data(filepath: str = None) -> pd.DataFrame:
     """Load the full VAERS 100-case cohort."""
     path = filepath or DATA_PATH
-    df = pd.read_csv(path)
+    df = pd.read_csv(path, usecols=lambda c: c in _COHORT_COLUMNS)
     print(f"Loaded {len(df)} cases from {path}")
     print(f"  Myocarditis: {(df['condition_type']=='myocarditis').sum()}")
     print(f"  Pericarditis: {(df['condition_type']=='pericarditis').sum()}")
@@ -27,10 +27,11 @@ Output:
   grounding_summary_<timestamp>.csv    — aggregate metrics (for paper Table/Figure)
 
 Usage:
-  python grounding_validator.py --results results_v4_full_100_<timestamp>.json
+  python grounding_validator.py --results results_v4_full_100_<timestamp>.json   # or a results/ dir → newest
                                 --vaers   vaers_jan_nov_2021.csv
                                 --backend anthropic
                                 [--sample N]          # validate N random cases
+                                [--workers N]         # concurrent judge calls across cases
                                 [--online]            # also append scores to pipeline run
 
 Author : Suah Cheon (MEC)  |  Vax-Beacon v4
@@ -44,10 +45,24 @@ import re
 import sys
 import time
 import random
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson  # optional: several-fold faster parsing of large results files
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa  # optional: vectorized scan of the full VAERS CSV
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+
 # ──────────────────────────────────────────────────────────────────────────────
 # 1. LLM Judge client (minimal, no dependency on main pipeline)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -137,18 +152,65 @@ def _judge(system_prompt: str, claim: str, source: str, backend: str) -> dict:
 # 3. Data loaders
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Low-cardinality labels repeated across every case; interned at load time
+# so case-type checks and per-category tallies compare by identity.
+_CATEGORICAL_FIELDS = (
+    ("stage5_causality", "who_category"),
+    ("stage6_guidance", "who_category"),
+    ("stage6_guidance", "mode"),
+    ("stage6_guidance", "unclassifiable_reason"),
+)
+
+
+def _intern_categoricals(case: dict) -> None:
+    ct = case.get("condition_type")
+    if isinstance(ct, str):
+        case["condition_type"] = sys.intern(ct)
+    stages = case.get("stages") or {}
+    for stage_key, field in _CATEGORICAL_FIELDS:
+        stage = stages.get(stage_key)
+        if stage and isinstance(stage.get(field), str):
+            stage[field] = sys.intern(stage[field])
+
+
 def load_results(path: str) -> list:
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
     if not isinstance(data, list):
         raise ValueError(f"Expected list of cases, got {type(data)}")
+    for case in data:
+        _intern_categoricals(case)
     print(f"[loader] Loaded {len(data)} cases from {path}")
     return data
 
 
-def load_vaers_narratives(vaers_csv_path: str) -> dict:
-    """Load VAERS CSV → {vaers_id (int): symptom_text (str)}"""
+_VAERS_ID_COLUMNS = ("VAERS_ID", "VAERSID")
+_VAERS_TEXT_COLUMNS = ("SYMPTOM_TEXT", "SYMPTOMTEXT")
+
+
+def _normalize_vaers_id(value) -> int | None:
+    """VAERS ID → int (surrounding whitespace / leading zeros ignored); None if unusable."""
+    try:
+        vid = int(str(value).strip())
+    except ValueError:
+        return None
+    return vid or None
+
+
+def load_vaers_narratives(vaers_csv_path: str, target_ids: set | None = None) -> dict:
+    """
+    Load VAERS CSV → {vaers_id (int): symptom_text (str)}
+
+    With target_ids, only those reports are kept and the scan stops once all
+    are found; pyarrow (if installed) then filters each batch in C++.
+    """
     narratives = {}
+    if target_ids is not None and not target_ids:
+        return narratives
     if not os.path.exists(vaers_csv_path):
         print(f"[loader] WARNING: VAERS CSV not found at {vaers_csv_path}. "
               f"Contract A validation will use narrative_summary fallback.")
@@ -156,17 +218,27 @@ def load_vaers_narratives(vaers_csv_path: str) -> dict:
 
     try:
         with open(vaers_csv_path, encoding="utf-8", errors="replace") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # VAERS standard column names
-                vaers_id_col = next((k for k in row if k.strip().upper() in ("VAERS_ID", "VAERSID")), None)
-                text_col = next((k for k in row if k.strip().upper() in ("SYMPTOM_TEXT", "SYMPTOMTEXT")), None)
-                if vaers_id_col and text_col:
+            # Plain csv.reader: rows stay lists, no per-row dict for the reports we skip
+            reader = csv.reader(f)
+            # VAERS standard column names — resolved once from the header
+            fields = next(reader, [])
+            vaers_id_col = next((k for k in fields if k.strip().upper() in _VAERS_ID_COLUMNS), None)
+            text_col = next((k for k in fields if k.strip().upper() in _VAERS_TEXT_COLUMNS), None)
+            if vaers_id_col and text_col and target_ids and pa is not None:
+                narratives = _scan_vaers_arrow(vaers_csv_path, vaers_id_col, text_col, target_ids)
+            elif vaers_id_col and text_col:
+                id_idx = fields.index(vaers_id_col)
+                text_idx = fields.index(text_col)
+                for row in reader:
                     try:
-                        vid = int(str(row[vaers_id_col]).strip())
-                        narratives[vid] = str(row[text_col]).strip()
-                    except (ValueError, KeyError):
-                        pass
+                        vid = _normalize_vaers_id(row[id_idx])
+                        if vid is None or (target_ids is not None and vid not in target_ids):
+                            continue
+                        narratives[vid] = row[text_idx].strip()
+                    except IndexError:
+                        continue
+                    if target_ids is not None and len(narratives) == len(target_ids):
+                        break
     except Exception as e:
         print(f"[loader] WARNING: Could not read VAERS CSV: {e}")
 
@@ -174,6 +246,34 @@ def load_vaers_narratives(vaers_csv_path: str) -> dict:
     return narratives
 
 
+def _scan_vaers_arrow(path: str, vaers_id_col: str, text_col: str, target_ids: set) -> dict:
+    """Stream the CSV in pyarrow batches, keeping rows whose VAERS_ID is in target_ids."""
+    # The narrative is read as raw bytes and decoded with errors="replace" like
+    # the csv fallback; IDs are plain digits, so skip UTF-8 validation for them.
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=16 << 20),
+        # Short/ragged rows are skipped, as the csv.reader path does
+        parse_options=pacsv.ParseOptions(newlines_in_values=True, invalid_row_handler=lambda row: "skip"),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=[vaers_id_col, text_col],
+            column_types={vaers_id_col: pa.string(), text_col: pa.binary()},
+            check_utf8=False,
+        ),
+    )
+    value_set = pa.array([str(vid) for vid in sorted(target_ids)], type=pa.string())
+    narratives = {}
+    for batch in reader:
+        # Same normalization as _normalize_vaers_id: drop padding and leading zeros
+        ids = pc.utf8_ltrim(pc.utf8_trim_whitespace(batch.column(vaers_id_col)), characters="0")
+        hits = batch.filter(pc.is_in(ids, value_set=value_set))
+        for vid, text in zip(hits.column(vaers_id_col).to_pylist(), hits.column(text_col).to_pylist()):
+            narratives[_normalize_vaers_id(vid)] = (text or b"").decode("utf-8", errors="replace").strip()
+        if len(narratives) == len(target_ids):
+            break
+    return narratives
+
+
 def load_knowledge_base(knowledge_dir: str) -> dict:
     """Load ddx_myocarditis.json and investigation_protocols.json."""
     kb = {}
@@ -633,13 +733,29 @@ def validate_contract_b(
 
 def _aggregate(contract_results: list, contract_name: str) -> dict:
     """Compute aggregate grounding statistics across cases."""
-    applicable = [r for r in contract_results if r.get("applicable")]
-    with_scores = [r for r in applicable if r.get("score") is not None]
-
-    if not with_scores:
+    # Single pass: counts, claim totals, scores and per-type breakdown
+    n_applicable = 0
+    total_claims = total_grounded = total_ungrounded = 0
+    scores = []
+    by_type = defaultdict(Counter)
+    for r in contract_results:
+        if not r.get("applicable"):
+            continue
+        n_applicable += 1
+        grounded = r.get("grounded", 0)
+        ungrounded = r.get("ungrounded", 0)
+        total_claims += r.get("total_claims", 0)
+        total_grounded += grounded
+        total_ungrounded += ungrounded
+        if r.get("score") is None:
+            continue
+        scores.append(r["score"])
+        by_type[r.get("case_type", "unknown")].update(n=1, grounded=grounded, ungrounded=ungrounded)
+
+    if not scores:
         return {
             "contract": contract_name,
-            "n_applicable": len(applicable),
+            "n_applicable": n_applicable,
             "n_with_scores": 0,
             "mean_score": None,
             "total_claims": 0,
@@ -648,38 +764,32 @@ def _aggregate(contract_results: list, contract_name: str) -> dict:
             "aggregate_score": None,
         }
 
-    total_claims = sum(r.get("total_claims", 0) for r in applicable)
-    total_grounded = sum(r.get("grounded", 0) for r in applicable)
-    total_ungrounded = sum(r.get("ungrounded", 0) for r in applicable)
-    mean_score = round(sum(r["score"] for r in with_scores) / len(with_scores), 3)
+    mean_score = round(sum(scores) / len(scores), 3)
     aggregate_score = round(
         total_grounded / (total_grounded + total_ungrounded), 3
     ) if (total_grounded + total_ungrounded) > 0 else None
 
-    # Breakdown by case type
-    by_type = {}
-    for r in with_scores:
-        ct = r.get("case_type", "unknown")
-        if ct not in by_type:
-            by_type[ct] = {"n": 0, "grounded": 0, "ungrounded": 0}
-        by_type[ct]["n"] += 1
-        by_type[ct]["grounded"] += r.get("grounded", 0)
-        by_type[ct]["ungrounded"] += r.get("ungrounded", 0)
-
-    for ct, d in by_type.items():
-        total = d["grounded"] + d["ungrounded"]
-        d["score"] = round(d["grounded"] / total, 3) if total > 0 else None
+    # Counters only tally; the report gets plain dicts with the score added
+    by_case_type = {}
+    for ct, tally in by_type.items():
+        total = tally["grounded"] + tally["ungrounded"]
+        by_case_type[ct] = {
+            "n": tally["n"],
+            "grounded": tally["grounded"],
+            "ungrounded": tally["ungrounded"],
+            "score": round(tally["grounded"] / total, 3) if total > 0 else None,
+        }
 
     return {
         "contract": contract_name,
-        "n_applicable": len(applicable),
-        "n_with_scores": len(with_scores),
+        "n_applicable": n_applicable,
+        "n_with_scores": len(scores),
         "mean_score": mean_score,
         "total_claims": total_claims,
         "total_grounded": total_grounded,
         "total_ungrounded": total_ungrounded,
         "aggregate_score": aggregate_score,
-        "by_case_type": by_type,
+        "by_case_type": by_case_type,
     }
 
 
@@ -730,7 +840,8 @@ def write_summary_csv(all_results: list, output_path: str) -> None:
 def parse_args():
     p = argparse.ArgumentParser(description="Vax-Beacon Grounding Validator (FACTS-inspired)")
     p.add_argument("--results", required=True,
-                   help="Path to results JSON (e.g. results_v4_full_100_*.json)")
+                   help="Path to results JSON (e.g. results_v4_full_100_*.json), "
+                        "or a directory to use its newest results_*.json")
     p.add_argument("--vaers", default=None,
                    help="Path to VAERS CSV with SYMPTOM_TEXT column")
     p.add_argument("--knowledge", default=None,
@@ -743,11 +854,40 @@ def parse_args():
                    help="Random seed for sampling (default: 42)")
     p.add_argument("--output-dir", default=None,
                    help="Output directory for results (default: same dir as --results)")
+    p.add_argument("--workers", type=int, default=1,
+                   help="Cases validated concurrently (judge calls are network-bound; default: 1)")
     p.add_argument("--quiet", action="store_true",
                    help="Suppress per-case progress output")
     return p.parse_args()
 
 
+def _validate_case(case: dict, narratives: dict, kb_vocab: str, backend: str) -> tuple:
+    """Run both contracts for one case. Returns (contract_a, contract_b, elapsed_s)."""
+    t0 = time.time()
+    ca = validate_contract_a(case, narratives, backend)
+    cb = validate_contract_b(case, kb_vocab, backend)
+    return ca, cb, round(time.time() - t0, 1)
+
+
+def resolve_results_path(path: str) -> str:
+    """If given a directory, return its most recently modified results_*.json."""
+    if not os.path.isdir(path):
+        return path
+    latest = None
+    with os.scandir(path) as it:
+        for entry in it:
+            name = entry.name
+            if (name.startswith("results_") and name.endswith(".json")
+                    and not name.endswith("_incremental.json") and entry.is_file()):
+                mtime = entry.stat().st_mtime
+                if latest is None or mtime > latest[0]:
+                    latest = (mtime, entry.path)
+    if latest is None:
+        raise FileNotFoundError(f"No results_*.json found in {path}")
+    print(f"[config] Using latest results file: {latest[1]}")
+    return latest[1]
+
+
 def auto_detect_paths(results_path: str) -> tuple:
     """Auto-detect VAERS CSV and knowledge dir from results path."""
     results_dir = Path(results_path).parent
@@ -775,6 +915,7 @@ def auto_detect_paths(results_path: str) -> tuple:
 
 def main():
     args = parse_args()
+    args.results = resolve_results_path(args.results)
 
     # ── Auto-detect paths ──────────────────────────────────────────────────
     vaers_path = args.vaers
@@ -801,9 +942,6 @@ def main():
 
     # ── Load data ──────────────────────────────────────────────────────────
     cases = load_results(args.results)
-    narratives = load_vaers_narratives(vaers_path) if vaers_path else {}
-    kb = load_knowledge_base(kb_path) if kb_path else {}
-    kb_vocab = _kb_vocabulary(kb)
 
     # ── Sample if requested ────────────────────────────────────────────────
     if args.sample:
@@ -811,6 +949,12 @@ def main():
         cases = random.sample(cases, min(args.sample, len(cases)))
         print(f"[config] Sampling {len(cases)} cases (seed={args.seed})")
 
+    # Only the narratives of the cases under validation are kept from the VAERS CSV
+    target_ids = {vid for vid in map(_normalize_vaers_id, (c.get("vaers_id") for c in cases)) if vid}
+    narratives = load_vaers_narratives(vaers_path, target_ids) if vaers_path else {}
+    kb = load_knowledge_base(kb_path) if kb_path else {}
+    kb_vocab = _kb_vocabulary(kb)
+
     # ── Validate ───────────────────────────────────────────────────────────
     all_results = []
     contract_a_results = []
@@ -818,43 +962,35 @@ def main():
 
     n = len(cases)
     print(f"\n{'='*60}")
-    print(f"Validating {n} cases | backend={args.backend}")
+    print(f"Validating {n} cases | backend={args.backend} | workers={args.workers}")
     print(f"{'='*60}\n")
 
-    for i, case in enumerate(cases):
-        vaers_id = case.get("vaers_id")
-        if not args.quiet:
-            print(f"[{i+1:3d}/{n}] VAERS {vaers_id} ...", end=" ", flush=True)
-
-        t0 = time.time()
-
-        # Contract A
-        ca = validate_contract_a(case, narratives, args.backend)
-        contract_a_results.append(ca)
-
-        # Contract B
-        cb = validate_contract_b(case, kb_vocab, args.backend)
-        contract_b_results.append(cb)
-
-        elapsed = round(time.time() - t0, 1)
-
-        if not args.quiet:
-            a_str = f"A={ca['score']:.2f}({ca['grounded']}/{ca['total_claims']})" if ca.get("score") is not None else f"A=N/A({ca.get('case_type','')})"
-            b_str = f"B={cb['score']:.2f}({cb['grounded']}/{cb['total_claims']})" if cb.get("score") is not None else f"B=N/A"
-            print(f"{a_str}  {b_str}  [{elapsed}s]")
-
-        # Attach grounding results to case copy
-        case_out = {k: v for k, v in case.items() if k != "stages"}  # omit heavy stages
-        case_out["contract_a"] = ca
-        case_out["contract_b"] = cb
-        # Keep minimal stage info for CSV
-        s5 = case.get("stages", {}).get("stage5_causality", {})
-        s6 = case.get("stages", {}).get("stage6_guidance", {})
-        case_out["stages"] = {
-            "stage5_causality": {"who_category": s5.get("who_category")},
-            "stage6_guidance": {"who_category": s6.get("who_category"), "mode": s6.get("mode")},
-        }
-        all_results.append(case_out)
+    # Cases are independent; results are consumed in input order
+    with ThreadPoolExecutor(max_workers=max(args.workers, 1)) as executor:
+        outcomes = executor.map(
+            lambda c: _validate_case(c, narratives, kb_vocab, args.backend), cases
+        )
+        for i, (case, (ca, cb, elapsed)) in enumerate(zip(cases, outcomes)):
+            contract_a_results.append(ca)
+            contract_b_results.append(cb)
+
+            if not args.quiet:
+                a_str = f"A={ca['score']:.2f}({ca['grounded']}/{ca['total_claims']})" if ca.get("score") is not None else f"A=N/A({ca.get('case_type','')})"
+                b_str = f"B={cb['score']:.2f}({cb['grounded']}/{cb['total_claims']})" if cb.get("score") is not None else f"B=N/A"
+                print(f"[{i+1:3d}/{n}] VAERS {case.get('vaers_id')} ... {a_str}  {b_str}  [{elapsed}s]")
+
+            # Attach grounding results to case copy
+            case_out = {k: v for k, v in case.items() if k != "stages"}  # omit heavy stages
+            case_out["contract_a"] = ca
+            case_out["contract_b"] = cb
+            # Keep minimal stage info for CSV
+            s5 = case.get("stages", {}).get("stage5_causality", {})
+            s6 = case.get("stages", {}).get("stage6_guidance", {})
+            case_out["stages"] = {
+                "stage5_causality": {"who_category": s5.get("who_category")},
+                "stage6_guidance": {"who_category": s6.get("who_category"), "mode": s6.get("mode")},
+            }
+            all_results.append(case_out)
 
     # ── Aggregate ──────────────────────────────────────────────────────────
     agg_a = _aggregate(contract_a_results, "Contract A: Stage 3A context ← VAERS narrative")
@@ -870,22 +1006,23 @@ def main():
     }
 
     # ── Print summary ──────────────────────────────────────────────────────
-    print(f"\n{'='*60}")
-    print("GROUNDING VALIDATION SUMMARY")
-    print(f"{'='*60}")
+    lines = [f"\n{'='*60}", "GROUNDING VALIDATION SUMMARY", f"{'='*60}"]
     for agg in [agg_a, agg_b]:
-        print(f"\n{agg['contract']}")
-        print(f"  Applicable cases : {agg['n_applicable']}")
-        print(f"  With scores      : {agg['n_with_scores']}")
-        print(f"  Total claims     : {agg['total_claims']}")
-        print(f"  Grounded         : {agg['total_grounded']}")
-        print(f"  Ungrounded       : {agg['total_ungrounded']}")
-        print(f"  Mean case score  : {agg['mean_score']}")
-        print(f"  Aggregate score  : {agg['aggregate_score']}  ← USE THIS FOR PAPER")
+        lines += [
+            f"\n{agg['contract']}",
+            f"  Applicable cases : {agg['n_applicable']}",
+            f"  With scores      : {agg['n_with_scores']}",
+            f"  Total claims     : {agg['total_claims']}",
+            f"  Grounded         : {agg['total_grounded']}",
+            f"  Ungrounded       : {agg['total_ungrounded']}",
+            f"  Mean case score  : {agg['mean_score']}",
+            f"  Aggregate score  : {agg['aggregate_score']}  ← USE THIS FOR PAPER",
+        ]
         if agg.get("by_case_type"):
-            print(f"  By case type:")
-            for ct, d in agg["by_case_type"].items():
-                print(f"    {ct}: n={d['n']}, score={d.get('score')}")
+            lines.append(f"  By case type:")
+            lines.extend(f"    {ct}: n={d['n']}, score={d.get('score')}"
+                         for ct, d in agg["by_case_type"].items())
+    print("\n".join(lines))
 
     # ── Write outputs ──────────────────────────────────────────────────────
     json_out = os.path.join(output_dir, f"grounding_results_{timestamp}.json")
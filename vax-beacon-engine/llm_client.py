@@ -9,7 +9,7 @@ import json
 import re
 import time
 import numpy as np
-from config import ANTHROPIC_API_KEY, ANTHROPIC_MODEL, MAX_TOKENS, TEMPERATURE
+from config import ANTHROPIC_API_KEY, ANTHROPIC_MODEL, MAX_TOKENS, TEMPERATURE, MEDGEMMA_QUANT
 
 
 # --- Custom JSON encoder for numpy types ---
@@ -67,7 +67,7 @@ class LLMClient:
     """
     Unified LLM interface.
     - Local: Anthropic Claude API
-    - MedGemma: google/medgemma-1.5-4b-it with 4-bit quantization
+    - MedGemma: google/medgemma-1.5-4b-it 4-bit by default (MEDGEMMA_QUANT)
     """
 
     # Stage-specific token budgets (stability-first)
@@ -98,14 +98,22 @@ class LLMClient:
         from transformers import AutoModelForImageTextToText, AutoProcessor, BitsAndBytesConfig
 
         model_id = "google/medgemma-1.5-4b-it"
-        print(f"  [MedGemma] Loading {model_id} with 4-bit quantization...")
 
-        bnb_config = BitsAndBytesConfig(
-            load_in_4bit=True,
-            bnb_4bit_use_double_quant=True,
-            bnb_4bit_quant_type="nf4",
-            bnb_4bit_compute_dtype=torch.bfloat16,
-        )
+        # Weight quantization (MEDGEMMA_QUANT): int4 default, int8, or none (bf16)
+        if MEDGEMMA_QUANT == "int4":
+            quant_kwargs = {"quantization_config": BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_use_double_quant=True,
+                bnb_4bit_quant_type="nf4",
+                bnb_4bit_compute_dtype=torch.bfloat16,
+            )}
+        elif MEDGEMMA_QUANT == "int8":
+            quant_kwargs = {"quantization_config": BitsAndBytesConfig(load_in_8bit=True)}
+        elif MEDGEMMA_QUANT == "none":
+            quant_kwargs = {"torch_dtype": torch.bfloat16}
+        else:
+            raise ValueError(f"Unknown MEDGEMMA_QUANT: {MEDGEMMA_QUANT} (expected int4, int8 or none)")
+        print(f"  [MedGemma] Loading {model_id} ({MEDGEMMA_QUANT} weights)...")
 
         # Attention implementation: prefer FA2, fallback to SDPA
         attn_impl = "sdpa"
@@ -120,9 +128,9 @@ class LLMClient:
 
         self.model = AutoModelForImageTextToText.from_pretrained(
             model_id,
-            quantization_config=bnb_config,
             device_map="auto",
             attn_implementation=attn_impl,
+            **quant_kwargs,
         )
 
         self.processor = AutoProcessor.from_pretrained(model_id)
@@ -187,7 +195,7 @@ class LLMClient:
     @staticmethod
     def _unwrap_list(parsed):
         """If LLM returned a JSON array, unwrap the first dict element."""
-        if isinstance(parsed, list) and len(parsed) > 0 and isinstance(parsed[0], dict):
+        if isinstance(parsed, list) and parsed and isinstance(parsed[0], dict):
             return parsed[0]
         return parsed
 
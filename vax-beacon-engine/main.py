@@ -34,10 +34,12 @@ import json
 import logging
 import os
 import re
+import shutil
 import sys
 import time
 import threading
 import traceback
+from collections import Counter
 from datetime import datetime, timedelta
 
 # Windows UTF-8 console fix — also apply to stderr
@@ -50,6 +52,11 @@ if sys.platform == "win32":
 
 import pandas as pd
 
+try:
+    import ijson  # optional: stream checkpoint results instead of loading the whole file
+except ImportError:
+    ijson = None
+
 from config import PROJECT_ROOT, RESULTS_PATH
 from llm_client import LLMClient
 from data_loader import load_vaers_data, get_case_input, get_ground_truth, get_sample_cases
@@ -249,31 +256,39 @@ def _load_checkpoint(tag: str) -> set:
     if not os.path.exists(RESULTS_PATH):
         return processed
 
+    # Single directory scan: newest results JSON (names carry a sortable
+    # timestamp, so max by name) plus every streaming CSV for this tag
+    json_prefix = f"results_{tag}_"
+    csv_prefix = f"streaming_{tag}_"
+    latest_json = None
+    csv_candidates = []
+    with os.scandir(RESULTS_PATH) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith(json_prefix) and name.endswith(".json"):
+                if latest_json is None or name > latest_json:
+                    latest_json = name
+            elif name.startswith(csv_prefix) and name.endswith(".csv"):
+                csv_candidates.append(name)
+    csv_candidates.sort()
+
     # Strategy 1: Load from results JSON (most reliable — has error info)
-    json_candidates = sorted([
-        f for f in os.listdir(RESULTS_PATH)
-        if f.startswith(f"results_{tag}_") and f.endswith(".json")
-    ])
-    if json_candidates:
-        latest = os.path.join(RESULTS_PATH, json_candidates[-1])
+    if latest_json:
+        latest = os.path.join(RESULTS_PATH, latest_json)
         try:
-            with open(latest, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            for r in data:
-                vid = r.get("vaers_id")
-                errors = r.get("errors", [])
-                # Only skip if completed without errors
-                if vid and not errors:
-                    processed.add(int(vid))
+            with open(latest, "rb") as f:
+                cases = ijson.items(f, "item") if ijson is not None else json.load(f)
+                for r in cases:
+                    vid = r.get("vaers_id")
+                    errors = r.get("errors", [])
+                    # Only skip if completed without errors
+                    if vid and not errors:
+                        processed.add(int(vid))
             _log(f"Checkpoint (JSON): {len(processed)} completed cases from {latest}")
         except Exception as e:
             _log(f"Checkpoint JSON load failed: {e}", "warning")
 
     # Strategy 2: Also load from streaming CSVs (crash-resilient)
-    csv_candidates = sorted([
-        f for f in os.listdir(RESULTS_PATH)
-        if f.startswith(f"streaming_{tag}_") and f.endswith(".csv")
-    ])
     for csv_file in csv_candidates:
         csv_path = os.path.join(RESULTS_PATH, csv_file)
         try:
@@ -368,6 +383,54 @@ _SUMMARY_CSV_COLUMNS = [
 ]
 
 
+def _summary_row(result: dict) -> dict:
+    """Flatten one pipeline result into a summary CSV row (_SUMMARY_CSV_COLUMNS)."""
+    stages = result.get("stages", {})
+    s2 = stages.get("stage2_brighton", {})
+    s3 = stages.get("stage3_ddx", {})
+    s4 = stages.get("stage4_temporal", {})
+    s5 = stages.get("stage5_causality", {})
+    s6 = stages.get("stage6_guidance", {})
+    temporal = s4.get("temporal_assessment", {})
+    mechanistic = s4.get("mechanistic_assessment", {})
+    gt = result.get("ground_truth", {})
+
+    # Early exit cases get WHO=Unclassifiable from Stage 6
+    who_cat = s5.get("who_category") or s6.get("who_category", "ERROR")
+
+    return {
+        "vaers_id": result.get("vaers_id"),
+        "condition_type": result.get("condition_type"),
+        "group": result.get("group"),
+        "early_exit": result.get("early_exit", False),
+        "brighton_level": s2.get("brighton_level"),
+        # Stage 3 = DDx (WHO Step 1)
+        "who_step1_conclusion": s3.get("who_step1_conclusion"),
+        "max_nci": s3.get("max_nci_score"),
+        "dominant_alternative": s3.get("dominant_alternative"),
+        # Stage 4 = Temporal + Known AE (WHO Step 2)
+        "temporal_zone": temporal.get("temporal_zone"),
+        "days_to_onset": temporal.get("days_to_onset"),
+        "known_ae": s4.get("known_ae_assessment", {}).get("is_known_ae"),
+        "who_step2_met": s4.get("who_step2_met"),
+        "high_risk": s4.get("high_risk_group", {}).get("is_high_risk"),
+        # Stage 5 = Final classification
+        "who_category": who_cat,
+        "confidence": s5.get("confidence"),
+        # Stage 6
+        "risk_signal": s6.get("overall_risk_signal"),
+        "mechanistic_score": mechanistic.get("mechanistic_score"),
+        "lge_pattern": mechanistic.get("lge_pattern"),
+        "isolated_fever": mechanistic.get("isolated_fever"),
+        "errors": len(result.get("errors", [])),
+        "total_time_s": result.get("processing_time", {}).get("total"),
+        # Ground truth
+        "gt_group": gt.get("group"),
+        "gt_severity": gt.get("curated_severity"),
+        "gt_onset_days": gt.get("curated_onset_days"),
+    }
+
+
 class _StreamingCSVWriter:
     """Write summary CSV rows incrementally with flush after each row."""
 
@@ -380,41 +443,7 @@ class _StreamingCSVWriter:
 
     def write_row(self, result: dict):
         """Extract summary fields from a pipeline result and write one CSV row."""
-        s5 = result.get("stages", {}).get("stage5_causality", {})
-        s2 = result.get("stages", {}).get("stage2_brighton", {})
-        s3 = result.get("stages", {}).get("stage3_ddx", {})
-        s4 = result.get("stages", {}).get("stage4_temporal", {})
-        s6 = result.get("stages", {}).get("stage6_guidance", {})
-        gt = result.get("ground_truth", {})
-
-        who_cat = s5.get("who_category") or s6.get("who_category", "ERROR")
-
-        row = {
-            "vaers_id": result.get("vaers_id"),
-            "condition_type": result.get("condition_type"),
-            "group": result.get("group"),
-            "early_exit": result.get("early_exit", False),
-            "brighton_level": s2.get("brighton_level"),
-            "who_step1_conclusion": s3.get("who_step1_conclusion"),
-            "max_nci": s3.get("max_nci_score"),
-            "dominant_alternative": s3.get("dominant_alternative"),
-            "temporal_zone": s4.get("temporal_assessment", {}).get("temporal_zone"),
-            "days_to_onset": s4.get("temporal_assessment", {}).get("days_to_onset"),
-            "known_ae": s4.get("known_ae_assessment", {}).get("is_known_ae"),
-            "who_step2_met": s4.get("who_step2_met"),
-            "high_risk": s4.get("high_risk_group", {}).get("is_high_risk"),
-            "who_category": who_cat,
-            "confidence": s5.get("confidence"),
-            "risk_signal": s6.get("overall_risk_signal"),
-            "mechanistic_score": s4.get("mechanistic_assessment", {}).get("mechanistic_score"),
-            "lge_pattern": s4.get("mechanistic_assessment", {}).get("lge_pattern"),
-            "isolated_fever": s4.get("mechanistic_assessment", {}).get("isolated_fever"),
-            "errors": len(result.get("errors", [])),
-            "total_time_s": result.get("processing_time", {}).get("total"),
-            "gt_group": gt.get("group"),
-            "gt_severity": gt.get("curated_severity"),
-            "gt_onset_days": gt.get("curated_onset_days"),
-        }
+        row = _summary_row(result)
         self._writer.writerow(row)
         self._file.flush()
 
@@ -790,54 +819,22 @@ def save_results(results: list, tag: str = ""):
     _safe_print(f"\nFull results: {json_path}")
 
     # Summary CSV
-    summary_rows = []
-    for r in results:
-        s5 = r.get("stages", {}).get("stage5_causality", {})
-        s2 = r.get("stages", {}).get("stage2_brighton", {})
-        s3 = r.get("stages", {}).get("stage3_ddx", {})
-        s4 = r.get("stages", {}).get("stage4_temporal", {})
-        s6 = r.get("stages", {}).get("stage6_guidance", {})
-        gt = r.get("ground_truth", {})
-
-        # Early exit cases get WHO=Unclassifiable from Stage 6
-        who_cat = s5.get("who_category") or s6.get("who_category", "ERROR")
-
-        summary_rows.append({
-            "vaers_id": r["vaers_id"],
-            "condition_type": r["condition_type"],
-            "group": r["group"],
-            "early_exit": r.get("early_exit", False),
-            "brighton_level": s2.get("brighton_level"),
-            # Stage 3 = DDx (WHO Step 1)
-            "who_step1_conclusion": s3.get("who_step1_conclusion"),
-            "max_nci": s3.get("max_nci_score"),
-            "dominant_alternative": s3.get("dominant_alternative"),
-            # Stage 4 = Temporal + Known AE (WHO Step 2)
-            "temporal_zone": s4.get("temporal_assessment", {}).get("temporal_zone"),
-            "days_to_onset": s4.get("temporal_assessment", {}).get("days_to_onset"),
-            "known_ae": s4.get("known_ae_assessment", {}).get("is_known_ae"),
-            "who_step2_met": s4.get("who_step2_met"),
-            "high_risk": s4.get("high_risk_group", {}).get("is_high_risk"),
-            # Stage 5 = Final classification
-            "who_category": who_cat,
-            "confidence": s5.get("confidence"),
-            # Stage 6
-            "risk_signal": s6.get("overall_risk_signal"),
-            "mechanistic_score": s4.get("mechanistic_assessment", {}).get("mechanistic_score"),
-            "lge_pattern": s4.get("mechanistic_assessment", {}).get("lge_pattern"),
-            "isolated_fever": s4.get("mechanistic_assessment", {}).get("isolated_fever"),
-            "errors": len(r.get("errors", [])),
-            "total_time_s": r.get("processing_time", {}).get("total"),
-            # Ground truth
-            "gt_group": gt.get("group"),
-            "gt_severity": gt.get("curated_severity"),
-            "gt_onset_days": gt.get("curated_onset_days"),
-        })
+    summary_rows = [_summary_row(r) for r in results]
 
     csv_path = os.path.join(RESULTS_PATH, f"summary{tag_str}_{timestamp}.csv")
     pd.DataFrame(summary_rows).to_csv(csv_path, index=False)
     _safe_print(f"Summary CSV: {csv_path}")
 
+    # Stable name for the newest summary (copy, not symlink — works on Windows);
+    # os.replace swaps it in atomically so readers never see a partial file
+    latest_path = os.path.join(RESULTS_PATH, f"latest{tag_str}.csv")
+    try:
+        shutil.copyfile(csv_path, latest_path + ".tmp")
+        os.replace(latest_path + ".tmp", latest_path)
+    except OSError as e:
+        # e.g. latest CSV held open in Excel on Windows — the timestamped copy is already saved
+        _log(f"Latest summary update failed: {e}", "warning")
+
     return json_path, csv_path
 
 
@@ -853,59 +850,103 @@ def _save_incremental(results: list, tag: str):
         _log(f"Incremental save failed: {e}", "warning")
 
 
-def print_summary_stats(results: list):
-    """Print aggregate statistics."""
+def summarize_results(results: list) -> dict:
+    """Aggregate run statistics into a JSON-serializable dict."""
     total = len(results)
-    early_exits = sum(1 for r in results if r.get("early_exit"))
-    errors = sum(len(r.get("errors", [])) for r in results)
 
-    _safe_print(f"\n{'='*60}")
-    _safe_print(f"  Vax-Beacon v4 Pipeline Summary")
-    _safe_print(f"  WHO AEFI Digital Manual Architecture (Deterministic Refactoring)")
-    _safe_print(f"{'='*60}")
-    _safe_print(f"  Total: {total} | Early Exit(L4): {early_exits} | Full Pipeline: {total - early_exits} | Errors: {errors}")
+    # Single pass: gather every per-case field used below
+    early_exits = 0
+    errors = 0
+    known_ae_count = 0
+    who_cats = Counter()
+    brighton = Counter()
+    full_times = []
+    exit_times = []
+    for r in results:
+        stages = r.get("stages", {})
+        errors += len(r.get("errors", []))
+        cat = (stages.get("stage5_causality", {}).get("who_category")
+               or stages.get("stage6_guidance", {}).get("who_category", "ERROR"))
+        who_cats[cat] += 1
+        brighton[stages.get("stage2_brighton", {}).get("brighton_level", "?")] += 1
+        if stages.get("stage4_temporal", {}).get("known_ae_assessment", {}).get("is_known_ae"):
+            known_ae_count += 1
+        t = r.get("processing_time", {}).get("total", 0)
+        if r.get("early_exit"):
+            early_exits += 1
+            exit_times.append(t)
+        else:
+            full_times.append(t)
+
+    return {
+        "total": total,
+        "early_exits": early_exits,
+        "full_pipeline": total - early_exits,
+        "errors": errors,
+        "known_ae": known_ae_count,
+        "who_categories": dict(sorted(who_cats.items())),
+        "brighton_levels": {str(k): brighton[k] for k in sorted(brighton.keys(), key=str)},
+        "timing": {
+            "full_mean_s": round(sum(full_times) / max(len(full_times), 1), 3),
+            "early_exit_mean_s": round(sum(exit_times) / len(exit_times), 3) if exit_times else None,
+            "total_s": sum(full_times) + sum(exit_times),
+        },
+    }
+
+
+def save_summary_stats(stats: dict, tag: str = ""):
+    """Write aggregate statistics as JSON for downstream tooling."""
+    os.makedirs(RESULTS_PATH, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    tag_str = f"_{tag}" if tag else ""
+    path = os.path.join(RESULTS_PATH, f"stats{tag_str}_{timestamp}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(stats, f, indent=2, ensure_ascii=False)
+    _safe_print(f"Summary stats JSON: {path}")
+    return path
+
+
+def print_summary_stats(stats: dict):
+    """Print aggregate statistics from summarize_results()."""
+    total = stats["total"]
+    early_exits = stats["early_exits"]
+    who_cats = stats["who_categories"]
+    timing = stats["timing"]
+
+    # Build the report first, then emit it with a single write
+    lines = [
+        f"\n{'='*60}",
+        f"  Vax-Beacon v4 Pipeline Summary",
+        f"  WHO AEFI Digital Manual Architecture (Deterministic Refactoring)",
+        f"{'='*60}",
+        f"  Total: {total} | Early Exit(L4): {early_exits} | Full Pipeline: {stats['full_pipeline']} | Errors: {stats['errors']}",
+    ]
 
     # WHO Categories
-    who_cats = {}
-    for r in results:
-        s5 = r.get("stages", {}).get("stage5_causality", {})
-        s6 = r.get("stages", {}).get("stage6_guidance", {})
-        cat = s5.get("who_category") or s6.get("who_category", "ERROR")
-        who_cats[cat] = who_cats.get(cat, 0) + 1
-    _safe_print(f"\n  WHO Category Distribution:")
-    for cat in sorted(who_cats.keys()):
-        count = who_cats[cat]
+    lines.append(f"\n  WHO Category Distribution:")
+    for cat, count in who_cats.items():
         pct = count / total * 100
         bar = "█" * int(pct / 2)
-        _safe_print(f"    {cat:5s}: {count:3d} ({pct:5.1f}%) {bar}")
+        lines.append(f"    {cat:5s}: {count:3d} ({pct:5.1f}%) {bar}")
 
     # Brighton Levels
-    brighton = {}
-    for r in results:
-        lvl = r.get("stages", {}).get("stage2_brighton", {}).get("brighton_level", "?")
-        brighton[lvl] = brighton.get(lvl, 0) + 1
-    _safe_print(f"\n  Brighton Level Distribution:")
-    for lvl in sorted(brighton.keys(), key=str):
-        _safe_print(f"    Level {lvl}: {brighton[lvl]}")
+    lines.append(f"\n  Brighton Level Distribution:")
+    lines.extend(f"    Level {lvl}: {n}" for lvl, n in stats["brighton_levels"].items())
 
     # Known AE check
-    known_ae_count = sum(
-        1 for r in results
-        if r.get("stages", {}).get("stage4_temporal", {}).get("known_ae_assessment", {}).get("is_known_ae")
-    )
-    _safe_print(f"\n  Known AE (Established): {known_ae_count} cases")
-    _safe_print(f"  Early Exit (Brighton L4): {early_exits} cases")
+    lines.append(f"\n  Known AE (Established): {stats['known_ae']} cases")
+    lines.append(f"  Early Exit (Brighton L4): {early_exits} cases")
 
     # Timing
-    times = [r.get("processing_time", {}).get("total", 0) for r in results]
-    if times:
-        full_times = [t for t, r in zip(times, results) if not r.get("early_exit")]
-        exit_times = [t for t, r in zip(times, results) if r.get("early_exit")]
-        _safe_print(f"\n  Processing Time:")
-        _safe_print(f"    Full pipeline mean: {sum(full_times)/max(len(full_times),1):.1f}s/case")
-        if exit_times:
-            _safe_print(f"    Early exit mean: {sum(exit_times)/len(exit_times):.1f}s/case")
-        _safe_print(f"    Total: {sum(times):.0f}s ({sum(times)/60:.1f}min)")
+    if total:
+        total_time = timing["total_s"]
+        lines.append(f"\n  Processing Time:")
+        lines.append(f"    Full pipeline mean: {timing['full_mean_s']:.1f}s/case")
+        if timing["early_exit_mean_s"] is not None:
+            lines.append(f"    Early exit mean: {timing['early_exit_mean_s']:.1f}s/case")
+        lines.append(f"    Total: {total_time:.0f}s ({total_time/60:.1f}min)")
+
+    _safe_print("\n".join(lines))
 
 
 def _prompt_choice(prompt: str, valid: range, allow_quit: bool = False) -> str:
@@ -937,16 +978,25 @@ def _display_case_list(df_display: pd.DataFrame, page: int = 0, page_size: int =
     start = page * page_size
     end = min(start + page_size, total)
 
-    print(f"\n  {'#':>4s}   {'VAERS_ID':>10s}   {'Age':>4s}  {'Sex':>3s}  {'Vaccine':<12s}  {'Group':<6s}  {'Condition'}")
-    print(f"  {'─'*4}   {'─'*10}   {'─'*4}  {'─'*3}  {'─'*12}  {'─'*6}  {'─'*12}")
-    for i, (_, row) in enumerate(df_display.iloc[start:end].iterrows(), start=start + 1):
-        vid = row["VAERS_ID"]
-        age = row.get("AGE_YRS", "?")
-        sex = row.get("SEX", "?")
-        vax = str(row.get("VAX_MANU", "?"))[:12]
-        group = row.get("group", "?")
-        cond = row.get("condition_type", "?")
-        print(f"  {i:4d}   {vid:>10d}   {str(age):>4s}  {sex:>3s}  {vax:<12s}  {group:<6s}  {cond}")
+    page_df = df_display.iloc[start:end]
+
+    def _column(name: str):
+        # Whole-column arrays instead of one Series per row; "?" if the column is absent
+        return page_df[name].to_numpy() if name in page_df else ["?"] * len(page_df)
+
+    lines = [
+        f"\n  {'#':>4s}   {'VAERS_ID':>10s}   {'Age':>4s}  {'Sex':>3s}  {'Vaccine':<12s}  {'Group':<6s}  {'Condition'}",
+        f"  {'─'*4}   {'─'*10}   {'─'*4}  {'─'*3}  {'─'*12}  {'─'*6}  {'─'*12}",
+    ]
+    lines.extend(
+        f"  {i:4d}   {vid:>10d}   {str(age):>4s}  {sex:>3s}  {str(vax)[:12]:<12s}  {group:<6s}  {cond}"
+        for i, vid, age, sex, vax, group, cond in zip(
+            range(start + 1, end + 1),
+            _column("VAERS_ID"), _column("AGE_YRS"), _column("SEX"),
+            _column("VAX_MANU"), _column("group"), _column("condition_type"),
+        )
+    )
+    print("\n".join(lines))
 
     print(f"\n  -- Page {page + 1}/{total_pages} ({start + 1}-{end} of {total}) --")
     return total_pages
@@ -1186,10 +1236,12 @@ def generate_benchmark_csv(llm: LLMClient, results: list, tag: str = ""):
 
     for i, r in enumerate(results):
         vaers_id = r["vaers_id"]
-        s2 = r.get("stages", {}).get("stage2_brighton", {})
-        s3 = r.get("stages", {}).get("stage3_ddx", {})
-        s5 = r.get("stages", {}).get("stage5_causality", {})
-        s6 = r.get("stages", {}).get("stage6_guidance", {})
+        stages = r.get("stages", {})
+        s2 = stages.get("stage2_brighton", {})
+        s3 = stages.get("stage3_ddx", {})
+        s5 = stages.get("stage5_causality", {})
+        s6 = stages.get("stage6_guidance", {})
+        temporal = stages.get("stage4_temporal", {}).get("temporal_assessment", {})
 
         # WHO category
         who_cat = s5.get("who_category") or s6.get("who_category", "ERROR")
@@ -1207,8 +1259,8 @@ def generate_benchmark_csv(llm: LLMClient, results: list, tag: str = ""):
             f"VAERS {vaers_id}: Brighton L{s2.get('brighton_level', '?')}, "
             f"NCI={s3.get('max_nci_score', 0)}, "
             f"Dominant alt: {s3.get('dominant_alternative', 'none')}, "
-            f"Temporal zone: {r.get('stages', {}).get('stage4_temporal', {}).get('temporal_assessment', {}).get('temporal_zone', '?')}, "
-            f"Days: {r.get('stages', {}).get('stage4_temporal', {}).get('temporal_assessment', {}).get('days_to_onset', '?')}, "
+            f"Temporal zone: {temporal.get('temporal_zone', '?')}, "
+            f"Days: {temporal.get('days_to_onset', '?')}, "
             f"WHO: {who_cat}, "
             f"Early exit: {r.get('early_exit', False)}"
         )
@@ -1269,6 +1321,9 @@ def main():
                         help="LLM backend (default: medgemma)")
     parser.add_argument("--resume", action="store_true",
                         help="Resume batch: skip cases already in latest results JSON")
+    parser.add_argument("--summary", type=str, default="text",
+                        choices=["text", "json", "both"],
+                        help="Summary stats format: console text, JSON file, or both (default: text)")
     args = parser.parse_args()
 
     llm = LLMClient(backend=args.backend)
@@ -1411,7 +1466,7 @@ def main():
                     _log(f"WARNING: VRAM usage high ({used:.2f} GB > 5.5 GB threshold)", "warning")
 
         # --- Incremental save every 25 cases (crash protection) ---
-        if is_batch and len(results) > 0 and len(results) % 25 == 0:
+        if is_batch and results and len(results) % 25 == 0:
             _save_incremental(results, tag)
 
     # --- Close streaming CSV ---
@@ -1421,16 +1476,19 @@ def main():
 
     # --- Final save & summary ---
     save_results(results, tag=tag)
-    print_summary_stats(results)
+    stats = summarize_results(results)
+    if args.summary in ("json", "both"):
+        save_summary_stats(stats, tag=tag)
+    if args.summary in ("text", "both"):
+        print_summary_stats(stats)
 
     # Batch failure report
     if failed_cases:
-        _safe_print(f"\n{'='*60}")
-        _safe_print(f"  FAILED CASES ({len(failed_cases)})")
-        _safe_print(f"{'='*60}")
+        lines = [f"\n{'='*60}", f"  FAILED CASES ({len(failed_cases)})", f"{'='*60}"]
         for vid, stage, err_msg in failed_cases:
-            _safe_print(f"    VAERS {vid} | Stage {stage} | {err_msg[:100]}")
+            lines.append(f"    VAERS {vid} | Stage {stage} | {err_msg[:100]}")
             _log(f"FAILED: VAERS {vid} | Stage {stage} | {err_msg}", "error")
+        _safe_print("\n".join(lines))
 
     if is_batch:
         total_elapsed = time.time() - batch_start
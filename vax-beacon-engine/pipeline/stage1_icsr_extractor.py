@@ -52,11 +52,17 @@ def _extract_field(text: str, label: str) -> str:
     return None
 
 
-def _extract_section(text: str, header: str) -> str:
-    """Extract content under a [HEADER] section."""
-    pattern = re.compile(r"\[" + re.escape(header) + r"\]\s*\n(.*?)(?=\n\[|\Z)", re.DOTALL)
-    m = pattern.search(text)
-    return m.group(1).strip() if m else None
+# Headers must sit on their own line, so a bracketed narrative line that spans
+# lines ("[per mother, fever started\nday 2]") is never read as a header
+_SECTION_RE = re.compile(r"^\[([^\]\n]+)\]\s*\n(.*?)(?=^\[|\Z)", re.MULTILINE | re.DOTALL)
+
+
+def _extract_sections(text: str) -> dict:
+    """Extract every [HEADER] section in one pass → {header: content}."""
+    sections = {}
+    for m in _SECTION_RE.finditer(text):
+        sections.setdefault(m.group(1), m.group(2).strip())
+    return sections
 
 
 def _parse_date(date_str: str) -> str:
@@ -91,7 +97,20 @@ def _parse_bool(val: str) -> bool:
     return None
 
 
-def _extract_onset_days_from_narrative(narrative: str) -> float:
+# --- Narrative onset-interval patterns (tried in order; text is lowercased) ---
+# Pattern 1: "Days from administration to presentation: 3 days" (literature format)
+_ONSET_LITERATURE_RE = re.compile(r"days?\s+from\s+(?:administration|vaccination)\s+to\s+presentation[:\s]+(?:is\s+)?(\d+)")
+# Pattern 2: onset verb + "X days after/post/following" (requires clinical context)
+_ONSET_VERB_RE = re.compile(r"(?:present(?:ed|ing)|develop(?:ed|ing)|experienc(?:ed|ing)|onset|symptoms?\s+(?:started|began|appeared))\s+(\d+)\s*days?\s+(?:after|post|following)")
+# Pattern 3: "X days after/post vaccine dose" (explicit dose reference)
+_ONSET_DOSE_RE = re.compile(r"(\d+)\s*days?\s+(?:after|post|following)\s+(?:the\s+)?(?:vaccine|vaccination|second|first|2nd|1st)\s+dose")
+# Pattern 4: "the next day" / "the following day" -> 1 day
+_ONSET_NEXT_DAY_RE = re.compile(r"(?:the\s+)?next\s+day|the\s+following\s+day")
+# Pattern 5: "same day" / "day of vaccination" -> 0 days
+_ONSET_SAME_DAY_RE = re.compile(r"same\s+day|day\s+of\s+(?:the\s+)?vaccin")
+
+
+def _extract_onset_days_from_narrative(text: str) -> float:
     """Fallback: extract days_to_onset from narrative text when CSV fields are empty.
 
     Targets literature reports that state onset interval in text, e.g.:
@@ -99,31 +118,25 @@ def _extract_onset_days_from_narrative(narrative: str) -> float:
       - "presented 9 days after her first vaccine dose"
       - "the next day"
       - "same day as vaccination"
+
+    `text` MUST already be lowercased: the patterns are case-sensitive and
+    matching mixed-case input silently misses (the caller lowers it once).
     Returns float (days) or None if no pattern matched.
     """
-    text = narrative.lower()
-
-    # Pattern 1: "Days from administration to presentation: 3 days" (literature format)
-    m = re.search(r"days?\s+from\s+(?:administration|vaccination)\s+to\s+presentation[:\s]+(?:is\s+)?(\d+)", text)
-    if m:
-        return float(m.group(1))
-
-    # Pattern 2: onset verb + "X days after/post/following" (requires clinical context)
-    m = re.search(r"(?:present(?:ed|ing)|develop(?:ed|ing)|experienc(?:ed|ing)|onset|symptoms?\s+(?:started|began|appeared))\s+(\d+)\s*days?\s+(?:after|post|following)", text)
-    if m:
-        return float(m.group(1))
+    # Every pattern needs the literal "day": one substring scan rules all five out
+    if "day" not in text:
+        return None
 
-    # Pattern 3: "X days after/post vaccine dose" (explicit dose reference)
-    m = re.search(r"(\d+)\s*days?\s+(?:after|post|following)\s+(?:the\s+)?(?:vaccine|vaccination|second|first|2nd|1st)\s+dose", text)
-    if m:
-        return float(m.group(1))
+    # Patterns 1-3 capture the day count; 4-5 map to a fixed interval
+    for pattern in (_ONSET_LITERATURE_RE, _ONSET_VERB_RE, _ONSET_DOSE_RE):
+        m = pattern.search(text)
+        if m:
+            return float(m.group(1))
 
-    # Pattern 4: "the next day" / "the following day" -> 1 day
-    if re.search(r"(?:the\s+)?next\s+day|the\s+following\s+day", text):
+    if _ONSET_NEXT_DAY_RE.search(text):
         return 1.0
 
-    # Pattern 5: "same day" / "day of vaccination" -> 0 days
-    if re.search(r"same\s+day|day\s+of\s+(?:the\s+)?vaccin", text):
+    if _ONSET_SAME_DAY_RE.search(text):
         return 0.0
 
     return None
@@ -163,10 +176,23 @@ def _run_stage1_medgemma(llm: LLMClient, case_text: str, original_text: str = No
     onset_date = _parse_date(onset_date_raw)
     numdays = _safe_float(_extract_field(code_text, "Days to Onset"))
 
+    # Sections — always from original untruncated text
+    sections = _extract_sections(code_text)
+    narrative = sections.get("NARRATIVE") or ""
+    lab_data = sections.get("LABORATORY DATA")
+    history = sections.get("MEDICAL HISTORY")
+    cur_ill = sections.get("CURRENT ILLNESS AT TIME OF VACCINATION")
+    meds = sections.get("MEDICATIONS")
+    allergies = sections.get("ALLERGIES")
+    coded_symptoms = sections.get("CODED SYMPTOMS (MedDRA)")
+
+    # Lowercased once; shared by the onset fallback and keyword fallbacks below
+    narrative_lower = narrative.lower()
+    coded_lower = (coded_symptoms or "").lower()
+
     # --- Narrative fallback: extract days_to_onset when CSV fields are empty ---
     if numdays is None and onset_date is None:
-        narrative = _extract_section(code_text, "NARRATIVE") or ""
-        numdays = _extract_onset_days_from_narrative(narrative)
+        numdays = _extract_onset_days_from_narrative(narrative_lower)
 
     # Outcomes
     died = _parse_bool(_extract_field(code_text, "Died"))
@@ -182,15 +208,6 @@ def _run_stage1_medgemma(llm: LLMClient, case_text: str, original_text: str = No
             pass
     recovered = _extract_field(code_text, "Recovered")
 
-    # Sections — always from original untruncated text
-    narrative = _extract_section(code_text, "NARRATIVE") or ""
-    lab_data = _extract_section(code_text, "LABORATORY DATA")
-    history = _extract_section(code_text, "MEDICAL HISTORY")
-    cur_ill = _extract_section(code_text, "CURRENT ILLNESS AT TIME OF VACCINATION")
-    meds = _extract_section(code_text, "MEDICATIONS")
-    allergies = _extract_section(code_text, "ALLERGIES")
-    coded_symptoms = _extract_section(code_text, "CODED SYMPTOMS (MedDRA)")
-
     # --- LLM: focused narrative analysis only ---
     llm_input = f"Narrative: {narrative}"
     if lab_data:
@@ -223,7 +240,7 @@ def _run_stage1_medgemma(llm: LLMClient, case_text: str, original_text: str = No
         crp = {}
 
     # --- Keyword-based fallback for clinical data ---
-    all_text = (narrative + " " + (lab_data or "") + " " + (coded_symptoms or "")).lower()
+    all_text = narrative_lower + " " + (lab_data or "").lower() + " " + coded_lower
 
     # Troponin fallback — try numeric extraction first, then keyword
     if not troponin.get("elevated"):
@@ -366,7 +383,7 @@ def _run_stage1_medgemma(llm: LLMClient, case_text: str, original_text: str = No
 
     # Determine primary diagnosis from coded symptoms and narrative
     primary_dx = "myocarditis"
-    combined_text = (narrative + " " + (coded_symptoms or "")).lower()
+    combined_text = narrative_lower + " " + coded_lower
     if "pericarditis" in combined_text and "myocarditis" not in combined_text:
         primary_dx = "pericarditis"
 
@@ -11,6 +11,8 @@ v4.3: Pending/ordered clinical data override — tests that were ordered
 but not completed are NOT treated as positive findings.
 """
 
+import re
+
 # --- Pending/Ordered status detection (v4.3) ---
 PENDING_KEYWORDS = [
     "ordered", "pending", "not completed", "not yet",
@@ -18,6 +20,24 @@ PENDING_KEYWORDS = [
     "to be done", "not available", "not performed",
     "not obtained", "awaited",
 ]
+_PENDING_RE = re.compile("|".join(map(re.escape, PENDING_KEYWORDS)), re.IGNORECASE)
+
+
+# --- Positive-finding / biopsy keyword alternations (matched on lowercased text) ---
+_ECG_POSITIVE_RE = re.compile(
+    r"abnormal|st(?:[ -](?:elevation|depression)| change| segment)"
+    r"|bundle branch block|t wave|pr depression"
+)
+_MRI_POSITIVE_RE = re.compile(r"abnormal|enhancement|lge|o?edema|myocarditis")
+_COMPATIBLE_SYMPTOMS_RE = re.compile(
+    r"chest pain|dyspnea|palpitation|heart failure"
+    r"|shortness of breath|cardiac|myocarditis|pericarditis"
+)
+_BIOPSY_MENTION_RE = re.compile(r"biopsy|endomyocardial|histopath")
+_BIOPSY_NEGATION_RE = re.compile(
+    r"not performed|no biopsy|without biopsy|biopsy was not"
+    r"|no endomyocardial|without pathological evidence|biopsy not|not done"
+)
 
 
 def _is_pending_status(value: str) -> bool:
@@ -28,8 +48,7 @@ def _is_pending_status(value: str) -> bool:
     """
     if not value:
         return False
-    lower = value.lower().strip()
-    return any(kw in lower for kw in PENDING_KEYWORDS)
+    return _PENDING_RE.search(value) is not None
 
 
 def run_stage2(icsr_data: dict) -> dict:
@@ -49,15 +68,7 @@ def run_stage2(icsr_data: dict) -> dict:
     ecg_str = str(ecg).strip() if ecg else ""
     ecg_lower = ecg_str.lower()
     # ECG abnormal: positive findings override "normal sinus rhythm"
-    _ecg_positive_findings = (
-        "abnormal" in ecg_lower
-        or "st elevation" in ecg_lower or "st-elevation" in ecg_lower
-        or "st depression" in ecg_lower or "st-depression" in ecg_lower
-        or "st change" in ecg_lower or "st segment" in ecg_lower
-        or "bundle branch block" in ecg_lower
-        or "t wave" in ecg_lower
-        or "pr depression" in ecg_lower
-    )
+    _ecg_positive_findings = bool(_ECG_POSITIVE_RE.search(ecg_lower))
     ecg_abnormal = (
         ecg is not None
         and ecg_str != ""
@@ -89,13 +100,7 @@ def run_stage2(icsr_data: dict) -> dict:
     mri_str = str(mri).strip() if mri else ""
     # MRI positive: LGE/enhancement/edema keywords override "normal LVEF"
     mri_lower = mri_str.lower()
-    _mri_positive_findings = (
-        "abnormal" in mri_lower
-        or "enhancement" in mri_lower
-        or "lge" in mri_lower
-        or "edema" in mri_lower or "oedema" in mri_lower
-        or "myocarditis" in mri_lower
-    )
+    _mri_positive_findings = bool(_MRI_POSITIVE_RE.search(mri_lower))
     mri_positive = (
         mri is not None
         and mri_str != ""
@@ -114,30 +119,23 @@ def run_stage2(icsr_data: dict) -> dict:
     symptoms_list = event.get("symptoms", [])
     narrative = event.get("narrative_summary", "")
     full_text = (" ".join(symptoms_list) + " " + narrative).lower()
-    _biopsy_mentioned = any(term in full_text for term in ["biopsy", "endomyocardial", "histopath"])
-    _biopsy_negated = any(neg in full_text for neg in [
-        "not performed", "no biopsy", "without biopsy", "biopsy was not",
-        "no endomyocardial", "without pathological evidence",
-        "biopsy not", "not done",
-    ])
+    _biopsy_mentioned = bool(_BIOPSY_MENTION_RE.search(full_text))
+    _biopsy_negated = bool(_BIOPSY_NEGATION_RE.search(full_text))
     if _biopsy_mentioned and not _biopsy_negated:
         histopathology = True
 
     # Compatible symptoms
-    compatible_symptoms = any(
-        term in full_text
-        for term in ["chest pain", "dyspnea", "palpitation", "heart failure",
-                     "shortness of breath", "cardiac", "myocarditis", "pericarditis"]
-    )
+    compatible_symptoms = _COMPATIBLE_SYMPTOMS_RE.search(full_text) is not None
 
     # Pericarditis-specific
     primary_dx = event.get("primary_diagnosis", "").lower()
     is_pericarditis = "pericarditis" in primary_dx
 
-    pericardial_effusion = False
-    for field in [echo, mri]:
-        if field and "effusion" in str(field).lower() and "no effusion" not in str(field).lower():
-            pericardial_effusion = True
+    # Lowercase each imaging field once; stop at the first positive report
+    pericardial_effusion = any(
+        "effusion" in text and "no effusion" not in text
+        for text in (str(field).lower() for field in (echo, mri) if field)
+    )
 
     crp_esr = clinical.get("crp_esr", {})
     inflammatory_elevated = crp_esr.get("elevated") is True
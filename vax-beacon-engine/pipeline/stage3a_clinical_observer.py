@@ -185,34 +185,40 @@ _NEGATION_PATTERNS = [
     (r"no\s+(?:biopsy|emb)", "No biopsy performed"),
 ]
 
+# Compiled case-insensitive once, so matching runs on the original narrative
+# without allocating a lowercased copy per case
+_KEYWORD_REGEXES = {
+    domain: [(re.compile(pattern, re.IGNORECASE), keyword_id) for pattern, keyword_id in patterns]
+    for domain, patterns in _KEYWORD_PATTERNS.items()
+}
+_NEGATION_REGEXES = [(re.compile(pattern, re.IGNORECASE), label) for pattern, label in _NEGATION_PATTERNS]
+
 
 def _extract_keywords_from_text(text: str) -> dict:
     """
     Extract clinical keywords from narrative using regex patterns.
     Returns: {domain: [(keyword_id, matched_text, context_snippet)]}
     """
-    text_lower = text.lower()
     results = {}
-    for domain, patterns in _KEYWORD_PATTERNS.items():
+    for domain, patterns in _KEYWORD_REGEXES.items():
         domain_matches = []
-        for pattern, keyword_id in patterns:
-            m = re.search(pattern, text_lower)
+        for regex, keyword_id in patterns:
+            m = regex.search(text)
             if m:
                 # Get context: 50 chars before and after
                 start = max(0, m.start() - 50)
                 end = min(len(text), m.end() + 50)
                 context = text[start:end].strip()
-                domain_matches.append((keyword_id, m.group(), context))
+                domain_matches.append((keyword_id, m.group().lower(), context))
         results[domain] = domain_matches
     return results
 
 
 def _extract_negatives(text: str) -> list:
     """Extract explicit negations from narrative."""
-    text_lower = text.lower()
     negatives = []
-    for pattern, label in _NEGATION_PATTERNS:
-        if re.search(pattern, text_lower):
+    for regex, label in _NEGATION_REGEXES:
+        if regex.search(text):
             negatives.append(label)
     return negatives[:5]
 
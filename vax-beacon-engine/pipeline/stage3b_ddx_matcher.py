@@ -16,6 +16,7 @@ Matching Rules:
 """
 
 import re
+from functools import lru_cache
 
 
 def _get_all_indicators(subtype_data: dict) -> list:
@@ -27,36 +28,46 @@ def _get_all_indicators(subtype_data: dict) -> list:
     return indicators
 
 
+@lru_cache(maxsize=None)
+def _keyword_matcher(keyword: str):
+    """
+    Per-keyword matcher, built once and reused across observations and cases:
+    a compiled word-boundary regex for short keywords, else the lowercased keyword.
+    """
+    kw_lower = keyword.lower()
+    if len(kw_lower) <= 3:
+        return re.compile(r'\b' + re.escape(kw_lower) + r'\b')
+    return kw_lower
+
+
 def _keyword_in_text(keyword: str, text_lower: str) -> bool:
     """
     Match a keyword in text. Short keywords (<=3 chars) use word-boundary
     matching to prevent false positives (e.g., "RA" matching "rapid").
     Longer keywords use substring matching.
     """
-    kw_lower = keyword.lower()
-    if len(kw_lower) <= 3:
-        return bool(re.search(r'\b' + re.escape(kw_lower) + r'\b', text_lower))
-    return kw_lower in text_lower
+    matcher = _keyword_matcher(keyword)
+    if isinstance(matcher, str):
+        return matcher in text_lower
+    return matcher.search(text_lower) is not None
 
 
-def _text_matches_keywords(text: str, keywords: list) -> str | None:
+def _text_matches_keywords(text_lower: str, keywords: list) -> str | None:
     """
-    Check if any keyword matches in the text (case-insensitive).
+    Check if any keyword matches in the (already lowercased) text.
     Short keywords use word-boundary matching; longer use substring.
     Returns the first matched keyword, or None.
     """
-    text_lower = text.lower()
     for kw in keywords:
         if _keyword_in_text(kw, text_lower):
             return kw
     return None
 
 
-def _text_matches_negative(text: str, negative_keywords: list) -> bool:
-    """Check if any negative keyword matches in the text."""
+def _text_matches_negative(text_lower: str, negative_keywords: list) -> bool:
+    """Check if any negative keyword matches in the (already lowercased) text."""
     if not negative_keywords:
         return False
-    text_lower = text.lower()
     for nkw in negative_keywords:
         if _keyword_in_text(nkw, text_lower):
             return True
@@ -67,7 +78,8 @@ def _collect_observation_texts(stage3a_output: dict) -> list:
     """
     Collect all observation texts from 3A output, including both
     the 'finding' description and the 'context' verbatim quote.
-    Each entry: (domain, finding_text, context_text, full_combined_text)
+    Each entry: (domain, finding_text, context_text, full_combined_text,
+    combined_lower) — lowercased once here so matching never re-lowers it.
     """
     observations = stage3a_output.get("clinical_observations", {})
     texts = []
@@ -81,6 +93,7 @@ def _collect_observation_texts(stage3a_output: dict) -> list:
                 "finding": finding,
                 "context": context,
                 "combined": combined,
+                "combined_lower": combined.lower(),
             })
     # Also check key_negatives — these could be relevant for negative_keywords
     return texts
@@ -124,28 +137,29 @@ def run_stage3b(stage3a_output: dict, ddx_db: dict) -> dict:
             diff_guide = indicator.get("differentiation_guide", "")
             weight = indicator.get("weight", 0.0)
 
+            # Key negatives mention this finding → no observation can match.
+            # Depends only on the indicator, so check once instead of per observation.
+            negated_by_key_negatives = _text_matches_negative(negatives_combined, ext_keywords[:3])
+
             # Search all 3A observations for keyword matches
             best_match = None
-            for obs in observation_texts:
-                matched_kw = _text_matches_keywords(obs["combined"], ext_keywords)
-                if matched_kw:
-                    # Check negative keywords against this same observation
-                    if _text_matches_negative(obs["combined"], neg_keywords):
-                        continue
-                    # Also check if key_negatives contradict this finding
-                    if _text_matches_negative(negatives_combined, ext_keywords[:3]):
-                        # Key negatives mention this finding → skip
-                        continue
-                    best_match = {
-                        "finding": finding_name,
-                        "matched_keyword": matched_kw,
-                        "source_observation": obs["finding"],
-                        "source_context": obs["context"],
-                        "source_domain": obs["domain"],
-                        "differentiation_guide": diff_guide,
-                        "weight": weight,
-                    }
-                    break  # Take first match per indicator
+            if not negated_by_key_negatives:
+                for obs in observation_texts:
+                    matched_kw = _text_matches_keywords(obs["combined_lower"], ext_keywords)
+                    if matched_kw:
+                        # Check negative keywords against this same observation
+                        if _text_matches_negative(obs["combined_lower"], neg_keywords):
+                            continue
+                        best_match = {
+                            "finding": finding_name,
+                            "matched_keyword": matched_kw,
+                            "source_observation": obs["finding"],
+                            "source_context": obs["context"],
+                            "source_domain": obs["domain"],
+                            "differentiation_guide": diff_guide,
+                            "weight": weight,
+                        }
+                        break  # Take first match per indicator
 
             if best_match:
                 matched_indicators.append(best_match)
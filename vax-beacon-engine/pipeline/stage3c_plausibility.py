@@ -221,9 +221,12 @@ def run_stage3c(
     # Build complete 38+3 marker output (backward compatible with v3.1)
     cleaned_findings = {}
 
+    # Markers both requested and answered by the LLM (set & dict-view)
+    evaluated = markers_to_evaluate & llm_findings.keys()
+
     # Fill all clinical markers
     for marker in _ALL_CLINICAL_MARKERS:
-        if marker in llm_findings and marker in markers_to_evaluate:
+        if marker in evaluated:
             val = llm_findings[marker]
             if isinstance(val, dict):
                 cleaned_findings[marker] = {
@@ -240,7 +243,7 @@ def run_stage3c(
 
     # Fill narrative nuance markers
     for marker in _NUANCE_MARKERS:
-        if marker in llm_findings and marker in markers_to_evaluate:
+        if marker in evaluated:
             val = llm_findings[marker]
             if isinstance(val, dict):
                 cleaned_findings[marker] = {
@@ -125,6 +125,10 @@ class NCIEngine:
             Dict with per-category scores, gate decisions, and overall assessment.
         """
         category_scores = {}
+        # Overall tallies, accumulated per category as it is scored
+        max_category = "none"
+        max_nci = 0.0
+        total_filtered = 0
 
         for category, markers in NCI_WEIGHT_MATRIX.items():
             score = 0.0
@@ -193,21 +197,14 @@ class NCIEngine:
                 "pass_count": len(passed_markers),
                 "filter_count": len(filtered_markers),
             }
+            total_filtered += len(filtered_markers)
 
-        # --- Overall assessment (exclude narrative_nuance from max) ---
-        clinical_scores = {
-            k: v for k, v in category_scores.items()
-            if k != "narrative_nuance"
-        }
-        if clinical_scores:
-            max_category = max(
-                clinical_scores,
-                key=lambda k: clinical_scores[k]["nci_score"],
-            )
-            max_nci = clinical_scores[max_category]["nci_score"]
-        else:
-            max_category = "none"
-            max_nci = 0.0
+            # Overall assessment (exclude narrative_nuance from max)
+            if category != "narrative_nuance" and (
+                max_category == "none" or capped_score > max_nci
+            ):
+                max_category = category
+                max_nci = capped_score
 
         # Narrative nuance — DECOUPLED from NCI (v3.1 design)
         nuance_score = category_scores.get(
@@ -224,9 +221,6 @@ class NCIEngine:
         else:
             conclusion = "NO_ALTERNATIVE"
 
-        # Total filtered count (noise reduction metric)
-        total_filtered = sum(v["filter_count"] for v in category_scores.values())
-
         return {
             "category_scores": category_scores,
             "max_nci_score": max_nci,
@@ -256,19 +250,22 @@ def _determine_status(cat_data: dict) -> str:
     return "EXCLUDED"
 
 
+# Human-readable category names
+_CATEGORY_LABELS = {
+    "viral_etiology": "Viral myocarditis (infectious)",
+    "giant_cell_myocarditis": "Giant cell myocarditis",
+    "eosinophilic_myocarditis": "Eosinophilic myocarditis",
+    "toxin_ici_myocarditis": "Toxin/ICI-induced myocarditis",
+    "ischemic_heart_disease": "Ischemic heart disease (CAD/MI)",
+    "covid19_related": "COVID-19 related myocarditis",
+    "autoimmune_inflammatory": "Autoimmune/inflammatory myocarditis",
+    "narrative_nuance": "Narrative clinical doubt",
+}
+
+
 def _category_label(cat_name: str) -> str:
     """Human-readable category names."""
-    labels = {
-        "viral_etiology": "Viral myocarditis (infectious)",
-        "giant_cell_myocarditis": "Giant cell myocarditis",
-        "eosinophilic_myocarditis": "Eosinophilic myocarditis",
-        "toxin_ici_myocarditis": "Toxin/ICI-induced myocarditis",
-        "ischemic_heart_disease": "Ischemic heart disease (CAD/MI)",
-        "covid19_related": "COVID-19 related myocarditis",
-        "autoimmune_inflammatory": "Autoimmune/inflammatory myocarditis",
-        "narrative_nuance": "Narrative clinical doubt",
-    }
-    return labels.get(cat_name, cat_name)
+    return _CATEGORY_LABELS.get(cat_name, cat_name)
 
 
 def _identify_gaps(findings: dict, nci_result: dict) -> list:
@@ -386,11 +383,19 @@ def merge_stage3(
     # Build information gaps
     information_gaps = _identify_gaps(stage3c, nci_result)
 
-    # Build alternative_etiologies list (same as v3.1)
+    category_scores = nci_result["category_scores"]
+
+    # Build alternative_etiologies list (same as v3.1), tracking the dominant
+    # alternative (first highest NCI, excluding narrative_nuance) in the same pass
     alternative_etiologies = []
-    for cat_name, cat_data in nci_result["category_scores"].items():
+    dominant_cat = None
+    dominant_nci = 0
+    for cat_name, cat_data in category_scores.items():
         if cat_name == "narrative_nuance":
             continue
+        if dominant_cat is None or cat_data["nci_score"] > dominant_nci:
+            dominant_cat = cat_name
+            dominant_nci = cat_data["nci_score"]
         if cat_data["nci_score"] > 0 or cat_data["filter_count"] > 0:
             status = (
                 _determine_status(cat_data) if cat_data["nci_score"] > 0
@@ -423,19 +428,8 @@ def merge_stage3(
     alternative_etiologies.sort(key=lambda x: x["nci_score"], reverse=True)
 
     # Dominant alternative (excluding narrative_nuance)
-    non_nuance = {
-        k: v for k, v in nci_result["category_scores"].items()
-        if k != "narrative_nuance"
-    }
-    if non_nuance:
-        dominant_cat = max(
-            non_nuance,
-            key=lambda k: non_nuance[k]["nci_score"],
-        )
-        dominant_nci = non_nuance[dominant_cat]["nci_score"]
-        dominant_label = (
-            _category_label(dominant_cat) if dominant_nci > 0 else "NONE"
-        )
+    if dominant_cat is not None and dominant_nci > 0:
+        dominant_label = _category_label(dominant_cat)
     else:
         dominant_label = "NONE"
 
@@ -443,7 +437,7 @@ def merge_stage3(
         "vaers_id": vaers_id,
         "engine": "v4 TWO-PASS (3A-Observer + 3B-Matcher + 3C-Assessor + 3D-NCI)",
         "llm_markers_extracted": stage3c,
-        "nci_detailed": nci_result["category_scores"],
+        "nci_detailed": category_scores,
         "alternative_etiologies": alternative_etiologies,
         "max_nci_score": nci_result["max_nci_score"],
         "max_nci_adjusted": nci_result["max_nci_score"],
@@ -451,7 +445,7 @@ def merge_stage3(
         "epistemic_uncertainty": nci_result.get("epistemic_uncertainty", 0),
         "dominant_alternative": dominant_label,
         "who_step1_conclusion": nci_result["who_step1_conclusion"],
-        "narrative_nuance": nci_result["category_scores"].get("narrative_nuance", {}),
+        "narrative_nuance": category_scores.get("narrative_nuance", {}),
         "noise_filtered_count": nci_result.get("noise_filtered_count", 0),
         "information_gaps": information_gaps,
         # v4 additions: preserve sub-stage outputs for auditability
@@ -15,6 +15,9 @@ NAM 2024 Windows for mRNA COVID-19 → Myocarditis:
   Beyond (>42d):    Causal association unlikely
 """
 
+import re
+from datetime import datetime
+
 from config import (
     NAM_CAUSAL_WINDOW_DAYS,
     MECHANISTIC_THRESHOLD_DAYS,
@@ -139,6 +142,17 @@ def _build_investigation_guidance(temporal_zone: str) -> dict:
 
 
 # --- Mechanistic Signature Detection (Nordic Study, Karlstad 2022) ---
+# Substring alternations: one scan of the text per keyword set
+_LGE_FOCAL_RE = re.compile(r"focal|punctate|patchy")
+_LGE_DIFFUSE_RE = re.compile(r"diffuse|global|widespread")
+_FEVER_RE = re.compile(r"fever|pyrexia|febrile|chills")
+_PRODROME_RE = re.compile(
+    r"cough|rhinorrhea|sore throat|congestion"
+    r"|diarrhea|vomiting|upper respiratory|uri"
+)
+_PRODROME_OBSERVATION_RE = re.compile(r"uri|respiratory|gastro|viral")
+
+
 def _detect_mechanistic_signatures(icsr_data: dict, ddx_data: dict) -> dict:
     """Detect pathognomonic signatures of vaccine-associated myocarditis (VAM).
 
@@ -158,15 +172,15 @@ def _detect_mechanistic_signatures(icsr_data: dict, ddx_data: dict) -> dict:
     mri_text = str(clinical.get("cardiac_mri", "") or "").lower()
     lge_pattern = "unknown"
 
-    if any(kw in mri_text for kw in ["focal", "punctate", "patchy"]):
+    if _LGE_FOCAL_RE.search(mri_text):
         lge_pattern = "focal_punctate"
         score += 0.3
         findings.append("MRI: Focal/punctate LGE (VAM signature)")
-    elif any(kw in mri_text for kw in ["diffuse", "global", "widespread"]):
+    elif _LGE_DIFFUSE_RE.search(mri_text):
         lge_pattern = "diffuse"
         score -= 0.1
         findings.append("MRI: Diffuse LGE (viral/systemic pattern)")
-    elif any(kw in mri_text for kw in ["subendocardial"]):
+    elif "subendocardial" in mri_text:
         lge_pattern = "subendocardial"
         score -= 0.1
         findings.append("MRI: Subendocardial LGE (ischemic pattern)")
@@ -180,17 +194,14 @@ def _detect_mechanistic_signatures(icsr_data: dict, ddx_data: dict) -> dict:
     symptoms = [s.lower() for s in event.get("symptoms", [])]
     all_symptom_text = " ".join(symptoms) + " " + narrative_text
 
-    has_fever = any(kw in all_symptom_text for kw in
-                    ["fever", "pyrexia", "febrile", "chills"])
-    has_prodrome = any(kw in all_symptom_text for kw in
-                       ["cough", "rhinorrhea", "sore throat", "congestion",
-                        "diarrhea", "vomiting", "upper respiratory", "uri"])
+    has_fever = _FEVER_RE.search(all_symptom_text) is not None
+    has_prodrome = _PRODROME_RE.search(all_symptom_text) is not None
 
     # Also check Stage 3A infectious_signs for prodromal indicators
     if infectious:
         for obs in infectious:
             finding = str(obs.get("finding", "")).lower()
-            if any(kw in finding for kw in ["uri", "respiratory", "gastro", "viral"]):
+            if _PRODROME_OBSERVATION_RE.search(finding):
                 has_prodrome = True
 
     if has_fever and not has_prodrome:
@@ -308,15 +319,20 @@ def run_stage4(icsr_data: dict, brighton_data: dict, ddx_data: dict) -> dict:
     }
 
 
+# --- Vaccine platform tokens (name + manufacturer, lowercased) ---
+_MRNA_VACCINE_TOKENS = ("pfizer", "biontech", "moderna", "comirnaty", "spikevax")
+_VIRAL_VECTOR_VACCINE_TOKENS = ("janssen", "johnson", "astrazeneca", "az", "covishield")
+
+
 def _identify_platform(vaccine: dict) -> str:
     """Identify vaccine platform from vaccine info."""
     name = str(vaccine.get("name", "")).lower()
     manu = str(vaccine.get("manufacturer", "")).lower()
     combined = name + " " + manu
 
-    if any(t in combined for t in ["pfizer", "biontech", "moderna", "comirnaty", "spikevax"]):
+    if any(t in combined for t in _MRNA_VACCINE_TOKENS):
         return "mRNA"
-    if any(t in combined for t in ["janssen", "johnson", "astrazeneca", "az", "covishield"]):
+    if any(t in combined for t in _VIRAL_VECTOR_VACCINE_TOKENS):
         return "viral_vector"
     if "covid" in combined:
         return "mRNA"  # Default assumption for COVID vaccines in VAERS
@@ -378,26 +394,28 @@ def _check_high_risk(demographics: dict, vaccine: dict, known_ae: dict) -> dict:
     return {"is_high_risk": False, "reason": None}
 
 
+# --- Date formats accepted by _calculate_days (ISO from Stage 1, VAERS MM/DD/YYYY) ---
+_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y")
+
+
+def _parse_any_date(value):
+    """Parse a date in any of _DATE_FORMATS; None if none match."""
+    text = str(value)
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
 def _calculate_days(vax_date: str, onset_date: str):
     """Calculate days between vaccination and onset."""
-    try:
-        from datetime import datetime
-        for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"]:
-            try:
-                vd = datetime.strptime(str(vax_date), fmt)
-                break
-            except ValueError:
-                vd = None
-        for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"]:
-            try:
-                od = datetime.strptime(str(onset_date), fmt)
-                break
-            except ValueError:
-                od = None
-        if vd and od:
-            return (od - vd).days
-    except Exception:
-        pass
+    vd = _parse_any_date(vax_date)
+    # Onset is only parsed when the vaccination date is usable
+    od = _parse_any_date(onset_date) if vd else None
+    if vd and od:
+        return (od - vd).days
     return None
 
 
@@ -35,6 +35,26 @@ _LABEL_TO_KEY = {
     "Autoimmune/inflammatory myocarditis": "autoimmune_inflammatory",
 }
 
+# Lowercased (label, key) pairs for the partial-match fallback
+_LABEL_TO_KEY_LOWER = tuple((label.lower(), key) for label, key in _LABEL_TO_KEY.items())
+
+# WHO category → overall risk signal (MedGemma code template)
+_RISK_SIGNAL_BY_CATEGORY = {
+    "A1": "HIGH", "B1": "MEDIUM", "B2": "MEDIUM", "C": "LOW", "Unclassifiable": "LOW",
+}
+
+# Short WHO category labels for officer summary
+_WHO_CATEGORY_LABELS = {
+    "A1": "Consistent causal association",
+    "A2": "Consistent causal association — product defect",
+    "A3": "Consistent causal association — immunization error",
+    "A4": "Consistent causal association — stress response",
+    "B1": "Indeterminate",
+    "B2": "Indeterminate — conflicting evidence",
+    "C": "Coincidental",
+    "Unclassifiable": "Unclassifiable — insufficient data",
+}
+
 
 def _get_protocol_for_dominant(dominant_label: str, protocols_db: dict) -> dict:
     """
@@ -54,8 +74,8 @@ def _get_protocol_for_dominant(dominant_label: str, protocols_db: dict) -> dict:
     # Fallback: case-insensitive partial match
     if not subtype_key:
         label_lower = dominant_label.lower()
-        for label, key in _LABEL_TO_KEY.items():
-            if label.lower() in label_lower or label_lower in label.lower():
+        for label, key in _LABEL_TO_KEY_LOWER:
+            if label in label_lower or label_lower in label:
                 subtype_key = key
                 break
 
@@ -498,8 +518,7 @@ def _normal_code_template(
         ]
 
     # Risk signal
-    risk_map = {"A1": "HIGH", "B1": "MEDIUM", "B2": "MEDIUM", "C": "LOW", "Unclassifiable": "LOW"}
-    risk_signal = risk_map.get(who_category, "MEDIUM")
+    risk_signal = _RISK_SIGNAL_BY_CATEGORY.get(who_category, "MEDIUM")
 
     # Quality flags
     quality_flags = {
@@ -632,17 +651,7 @@ def _build_officer_summary(who_category, condition, age, sex, days_to_onset, dom
 
 def _who_category_label(who_category: str) -> str:
     """Short WHO category label for officer summary."""
-    labels = {
-        "A1": "Consistent causal association",
-        "A2": "Consistent causal association — product defect",
-        "A3": "Consistent causal association — immunization error",
-        "A4": "Consistent causal association — stress response",
-        "B1": "Indeterminate",
-        "B2": "Indeterminate — conflicting evidence",
-        "C": "Coincidental",
-        "Unclassifiable": "Unclassifiable — insufficient data",
-    }
-    return labels.get(who_category, who_category)
+    return _WHO_CATEGORY_LABELS.get(who_category, who_category)
 
 
 def _run_onset_unknown(
@@ -75,7 +75,7 @@ def render_docx(md_path: str) -> str | None:
             run.italic = True
         # Table rows -> skip header separators, add as plain text
         elif line.startswith("|"):
-            if set(line.replace("|", "").replace("-", "").strip()) == set():
+            if not line.replace("|", "").replace("-", "").strip():
                 continue  # separator row like |---|---|
             cells = [c.strip() for c in line.split("|")[1:-1]]
             p = doc.add_paragraph("  |  ".join(cells))
@@ -7,9 +7,9 @@ Run: python test_fewshot_stage1.py
 
 import json
 import time
-import re
 from data_loader import load_vaers_data, get_case_input
 from llm_client import LLMClient
+from pipeline.stage1_icsr_extractor import _extract_sections
 
 # --- Draft prompt with 3 few-shot examples ---
 STAGE1_FEWSHOT_DRAFT = """Extract clinical data from this medical narrative. Output ONLY JSON.
@@ -38,12 +38,6 @@ Now extract:
 TEST_CASES = [1740551, 1661275, 1412506]
 
 
-def _extract_section(text, header):
-    pattern = re.compile(r"\[" + re.escape(header) + r"\]\s*\n(.*?)(?=\n\[|\Z)", re.DOTALL)
-    m = pattern.search(text)
-    return m.group(1).strip() if m else None
-
-
 def run_test():
     df = load_vaers_data()
     print()
@@ -63,9 +57,10 @@ def run_test():
         case_text = get_case_input(row)
 
         # Build LLM input (same as _run_stage1_medgemma)
-        narrative = _extract_section(case_text, "NARRATIVE") or ""
-        lab_data = _extract_section(case_text, "LABORATORY DATA")
-        coded_symptoms = _extract_section(case_text, "CODED SYMPTOMS (MedDRA)")
+        sections = _extract_sections(case_text)
+        narrative = sections.get("NARRATIVE") or ""
+        lab_data = sections.get("LABORATORY DATA")
+        coded_symptoms = sections.get("CODED SYMPTOMS (MedDRA)")
 
         llm_input = f"Narrative: {narrative}"
         if lab_data:
@@ -100,9 +100,13 @@ print("=" * 90)
 
 with open(DATA_PATH, "r", encoding="utf-8") as f:
     reader = csv.DictReader(f)
+    pending = set(target_ids)
     for row in reader:
-        if row["VAERS_ID"] in target_ids:
-            vid = row["VAERS_ID"]
+        if not pending:
+            break  # all target cases seen — skip the rest of the cohort
+        vid = row["VAERS_ID"]
+        if vid in pending:
+            pending.discard(vid)
             narr = row.get("SYMPTOM_TEXT", "")
             lab = row.get("LAB_DATA", "")
             coded = ", ".join([row.get(f"SYMPTOM{i}", "").strip() 
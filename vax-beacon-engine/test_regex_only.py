@@ -9,31 +9,37 @@ import re
 import csv
 
 
+# --- Narrative onset-interval patterns (tried in order; text is lowercased) ---
+# Pattern 1: "Days from administration to presentation: 3 days" (literature format)
+_ONSET_LITERATURE_RE = re.compile(r"days?\s+from\s+(?:administration|vaccination)\s+to\s+presentation[:\s]+(?:is\s+)?(\d+)")
+# Pattern 2: onset verb + "X days after/post/following" (requires clinical context)
+_ONSET_VERB_RE = re.compile(r"(?:present(?:ed|ing)|develop(?:ed|ing)|experienc(?:ed|ing)|onset|symptoms?\s+(?:started|began|appeared))\s+(\d+)\s*days?\s+(?:after|post|following)")
+# Pattern 3: "X days after/post vaccine dose" (explicit dose reference)
+_ONSET_DOSE_RE = re.compile(r"(\d+)\s*days?\s+(?:after|post|following)\s+(?:the\s+)?(?:vaccine|vaccination|second|first|2nd|1st)\s+dose")
+# Pattern 4: "the next day" / "the following day" -> 1 day
+_ONSET_NEXT_DAY_RE = re.compile(r"(?:the\s+)?next\s+day|the\s+following\s+day")
+# Pattern 5: "same day" / "day of vaccination" -> 0 days
+_ONSET_SAME_DAY_RE = re.compile(r"same\s+day|day\s+of\s+(?:the\s+)?vaccin")
+
+
 def _extract_onset_days_from_narrative(narrative: str) -> float:
     """Fallback: extract days_to_onset from narrative text when CSV fields are empty."""
     text = narrative.lower()
 
-    # Pattern 1: "Days from administration to presentation: 3 days" (literature format)
-    m = re.search(r"days?\s+from\s+(?:administration|vaccination)\s+to\s+presentation[:\s]+(?:is\s+)?(\d+)", text)
-    if m:
-        return float(m.group(1))
-
-    # Pattern 2: onset verb + "X days after/post/following" (requires clinical context)
-    m = re.search(r"(?:present(?:ed|ing)|develop(?:ed|ing)|experienc(?:ed|ing)|onset|symptoms?\s+(?:started|began|appeared))\s+(\d+)\s*days?\s+(?:after|post|following)", text)
-    if m:
-        return float(m.group(1))
+    # Every pattern needs the literal "day": one substring scan rules all five out
+    if "day" not in text:
+        return None
 
-    # Pattern 3: "X days after/post vaccine dose" (explicit dose reference)
-    m = re.search(r"(\d+)\s*days?\s+(?:after|post|following)\s+(?:the\s+)?(?:vaccine|vaccination|second|first|2nd|1st)\s+dose", text)
-    if m:
-        return float(m.group(1))
+    # Patterns 1-3 capture the day count; 4-5 map to a fixed interval
+    for pattern in (_ONSET_LITERATURE_RE, _ONSET_VERB_RE, _ONSET_DOSE_RE):
+        m = pattern.search(text)
+        if m:
+            return float(m.group(1))
 
-    # Pattern 4: "the next day" / "the following day" -> 1 day
-    if re.search(r"(?:the\s+)?next\s+day|the\s+following\s+day", text):
+    if _ONSET_NEXT_DAY_RE.search(text):
         return 1.0
 
-    # Pattern 5: "same day" / "day of vaccination" -> 0 days
-    if re.search(r"same\s+day|day\s+of\s+(?:the\s+)?vaccin", text):
+    if _ONSET_SAME_DAY_RE.search(text):
         return 0.0
 
     return None
@@ -50,8 +56,12 @@ target_ids = {"1299305", "1482907", "1482909"}
 try:
     with open(DATA_PATH, "r", encoding="utf-8") as f:
         reader = csv.DictReader(f)
+        pending = set(target_ids)
         for row in reader:
-            if row["VAERS_ID"] in target_ids:
+            if not pending:
+                break  # all target cases seen — skip the rest of the cohort
+            if row["VAERS_ID"] in pending:
+                pending.discard(row["VAERS_ID"])
                 narr = row.get("SYMPTOM_TEXT", "")
                 result = _extract_onset_days_from_narrative(narr)
                 status = "OK" if result is not None else "FAIL (None)"
@@ -59,11 +69,11 @@ try:
                 # Show which pattern matched
                 if result is not None:
                     text = narr.lower()
-                    m1 = re.search(r"days?\s+from\s+(?:administration|vaccination)\s+to\s+presentation[:\s]+(?:is\s+)?(\d+)", text)
+                    m1 = _ONSET_LITERATURE_RE.search(text)
                     if m1:
                         print(f"    Matched pattern 1: '{m1.group(0)}'")
                         continue
-                    m2 = re.search(r"(?:present(?:ed|ing)|develop(?:ed|ing)|experienc(?:ed|ing)|onset|symptoms?\s+(?:started|began|appeared))\s+(\d+)\s*days?\s+(?:after|post|following)", text)
+                    m2 = _ONSET_VERB_RE.search(text)
                     if m2:
                         print(f"    Matched pattern 2: '{m2.group(0)}'")
 except FileNotFoundError:
@@ -0,0 +1,9 @@
+"""
+Shared pytest setup: make the engine root (config, pipeline/) importable
+once per session instead of each test module mutating sys.path.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -6,6 +6,7 @@ Tests the WHO AEFI decision tree including v4.1a UNKNOWN onset path.
 import sys
 import os
 
+# Script mode (python tests/test_classify.py); under pytest, tests/conftest.py does this
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from pipeline.stage5_causality_assessor import classify
@@ -0,0 +1,66 @@
+"""
+Unit tests for grounding_validator.load_vaers_narratives() — the csv.reader
+scan and the pyarrow scan must return the same narratives.
+"""
+
+import pytest
+
+import grounding_validator as gv
+
+
+VAERS_CSV = (
+    'VAERS_ID,AGE_YRS,SYMPTOM_TEXT\n'
+    '1001,19,"chest pain,\nfever"\n'
+    ' 1002 ,22,padded id\n'
+    '01003,30,leading zero\n'
+    '1005,60\n'
+    'x,40,bad id\n'
+    '1004,50,"not a target"\n'
+)
+
+
+@pytest.fixture
+def vaers_csv(tmp_path):
+    path = tmp_path / "vaers.csv"
+    path.write_text(VAERS_CSV, encoding="utf-8")
+    return str(path)
+
+
+def test_csv_scan_all(vaers_csv, monkeypatch):
+    monkeypatch.setattr(gv, "pa", None)
+    assert gv.load_vaers_narratives(vaers_csv) == {
+        1001: "chest pain,\nfever",
+        1002: "padded id",
+        1003: "leading zero",
+        1004: "not a target",
+    }
+
+
+def test_csv_scan_targets(vaers_csv, monkeypatch):
+    monkeypatch.setattr(gv, "pa", None)
+    assert gv.load_vaers_narratives(vaers_csv, {1002, 1003, 9999}) == {
+        1002: "padded id",
+        1003: "leading zero",
+    }
+
+
+def test_arrow_scan_matches_csv_scan(vaers_csv, monkeypatch):
+    pytest.importorskip("pyarrow")
+    targets = {1001, 1002, 1003, 1005, 9999}
+    arrow = gv.load_vaers_narratives(vaers_csv, targets)
+    monkeypatch.setattr(gv, "pa", None)
+    assert arrow == gv.load_vaers_narratives(vaers_csv, targets)
+    assert arrow[1001] == "chest pain,\nfever"
+    assert 1005 not in arrow  # truncated row skipped, not a failed scan
+
+
+def test_empty_targets(vaers_csv):
+    assert gv.load_vaers_narratives(vaers_csv, set()) == {}
+
+
+def test_normalize_vaers_id():
+    assert gv._normalize_vaers_id(" 01003 ") == 1003
+    assert gv._normalize_vaers_id(1003) == 1003
+    assert gv._normalize_vaers_id(None) is None
+    assert gv._normalize_vaers_id("0") is None
+    assert gv._normalize_vaers_id("x") is None
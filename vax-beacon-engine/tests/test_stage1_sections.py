@@ -0,0 +1,42 @@
+"""
+Unit tests for Stage 1 _extract_sections() case-text splitting.
+"""
+
+from pipeline.stage1_icsr_extractor import _extract_sections
+
+
+CASE_TEXT = (
+    "=== VAERS REPORT ID: 1 ===\n\n"
+    "[DEMOGRAPHICS]\nAge: 19\nSex: M\n\n"
+    "[CODED SYMPTOMS (MedDRA)]\nChest pain, Myocarditis\n\n"
+    "[NARRATIVE]\nPt had chest pain.\n\n"
+    "[LABORATORY DATA]\ntroponin 5\n"
+)
+
+
+def test_all_sections():
+    sections = _extract_sections(CASE_TEXT)
+    assert sections["DEMOGRAPHICS"] == "Age: 19\nSex: M"
+    assert sections["CODED SYMPTOMS (MedDRA)"] == "Chest pain, Myocarditis"
+    assert sections["NARRATIVE"] == "Pt had chest pain."
+    assert sections["LABORATORY DATA"] == "troponin 5"
+
+
+def test_missing_section():
+    assert _extract_sections(CASE_TEXT).get("MEDICATIONS") is None
+
+
+def test_bracketed_narrative_line():
+    """An unclosed '[' in the narrative must not swallow the next real header."""
+    text = (
+        "[NARRATIVE]\nPt had chest pain.\n[per mother, fever started\nday 2]\n\n"
+        "[LABORATORY DATA]\ntroponin 5"
+    )
+    sections = _extract_sections(text)
+    assert sections["NARRATIVE"] == "Pt had chest pain."
+    assert sections["LABORATORY DATA"] == "troponin 5"
+
+
+def test_first_occurrence_wins():
+    text = "[NARRATIVE]\nfirst\n[NARRATIVE]\nsecond"
+    assert _extract_sections(text)["NARRATIVE"] == "first"